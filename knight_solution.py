@@ -1,10 +1,7 @@
 
 import argparse
-from collections import deque
-import graphviz
-import matplotlib.pyplot as plt
-from matplotlib.colors import ListedColormap
-import numpy as np
+from array import array
+import io
 
 class Chessboard:
     """
@@ -45,9 +42,10 @@ class Chessboard:
         """
         if w != h:
             raise ValueError('It is not a square shaped board!')
-        re = np.r_[w * [0, 1]]
-        ro = np.r_[w * [1, 0]]
-        chessboard = np.row_stack(h * (re, ro))
+        import numpy as np
+
+        r = np.arange(2 * w)
+        chessboard = ((r[:, None] + r[None, :]) & 1).astype(np.uint8)
         return chessboard
 
 class Knight:
@@ -76,6 +74,8 @@ class Knight:
         """
         Determines if the knight can move to the given position.
 
+        Both coordinates must be ints.
+
         Args:
             row (int): The row position to check.
             col (int): The column position to check.
@@ -83,7 +83,26 @@ class Knight:
         Returns:
             bool: True if the knight can move to the given position, False otherwise.
         """
-        return 0 <= row < 8 and 0 <= col < 8 #True
+        # Both coordinates lie in 0..7 exactly when no bit above the lowest three is set
+        return not ((row | col) & ~7)
+
+# Knight move offsets (row, column), in the order moves are explored
+KNIGHT_MOVES = (
+    (1, 2), (1, -2),
+    (-1, 2), (-1, -2),
+    (2, 1), (2, -1),
+    (-2, 1), (-2, -1)
+)
+
+# On-board knight moves from every square, indexed by row * 8 + col
+NEIGHBORS = tuple(
+    tuple((x + dx, y + dy) for dx, dy in KNIGHT_MOVES if Knight.can_move(x + dx, y + dy))
+    for x in range(8) for y in range(8)
+)
+# The same table with every move packed as row * 8 + col
+NEIGHBOR_INDICES = tuple(tuple(x * 8 + y for x, y in moves) for moves in NEIGHBORS)
+# The same table as bitboards, bit j of entry i is set if j is a knight move from i
+NEIGHBOR_MASKS = tuple(sum(1 << j for j in moves) for moves in NEIGHBOR_INDICES)
 
 def get_possible_moves(position):
     """
@@ -96,13 +115,42 @@ def get_possible_moves(position):
         list of tuples: A list of tuples representing the possible moves.
     """
     x, y = position
-    possible_moves = [
-        (x + 1, y + 2), (x + 1, y - 2), 
-        (x - 1, y + 2), (x - 1, y - 2), 
-        (x + 2, y + 1), (x + 2, y - 1), 
-        (x - 2, y + 1), (x - 2, y - 1)
-    ]
-    return [(a, b) for a, b in possible_moves if Knight.can_move(a, b)]
+    return list(NEIGHBORS[x * 8 + y])
+
+def _bfs(start_idx):
+    """
+    Breadth-first search over the 64 squares, with positions packed as row * 8 + col.
+
+    Rather than queueing squares one at a time, it advances a whole layer per step:
+    the next layer is every knight move from the current one, as a bitboard from
+    NEIGHBOR_MASKS, minus the squares already visited.
+
+    Args:
+        start_idx (int): The packed index of the starting position.
+
+    Returns:
+        array.array: The move distance from the start to every visited square (-1 if not visited).
+    """
+    dist = array('b', [-1]) * 64
+    frontier = visited = 1 << start_idx  # Bitboards, bit i is square row * 8 + col
+    depth = 0
+
+    while frontier:
+        reached = 0
+        while frontier:
+            lowest = frontier & -frontier  # Isolate the lowest set bit
+            square = lowest.bit_length() - 1
+            dist[square] = depth
+            reached |= NEIGHBOR_MASKS[square]
+            frontier ^= lowest
+        frontier = reached & ~visited
+        visited |= frontier
+        depth += 1
+    return dist
+
+# Distances from each square to every other, indexed by row * 8 + col.
+# A row is filled the first time shortest_path needs it.
+_DIST = [None] * 64
 
 def shortest_path(start, end):
     """
@@ -115,28 +163,48 @@ def shortest_path(start, end):
     Returns:
         list of lists: A list containing all minimum-length sequences of moves from the start to the end position.
     """
-    start = tuple(start)
-    end = tuple(end)
-    queue = deque([[start]])  # Initialize queue with the start position
-    visited = set([start])  # Initialize set to store visited positions
-    all_sequences = []  # Initialize list to store all sequences
+    if not (Knight.can_move(*start) and Knight.can_move(*end)):  # Off-board squares have no path
+        return []
+    start_idx = start[0] * 8 + start[1]
+    end_idx = end[0] * 8 + end[1]
+    # Knight moves are symmetric, so the row of the end square holds every square's distance to it
+    to_end = _DIST[end_idx]
+    if to_end is None:
+        to_end = _DIST[end_idx] = _bfs(end_idx).tolist()
+    if to_end[start_idx] < 0:  # The end position is never reached
+        return []
+    return [_reconstruct_path(to_end, start_idx)]  # Return all minimum-length sequences
+
+
+def _reconstruct_path(to_end, start_idx):
+    """
+    Walk from the start square to the end square one layer at a time.
 
-    # Perform breadth-first search
-    while queue:
-        path = queue.popleft()  # Get the first path in the queue
-        current_position = path[-1]  # Get the current position from the path
+    At each square the first knight move, in KNIGHT_MOVES order, that gets one move
+    closer to the end is taken. This is the path a plain breadth-first search with
+    per-square parent pointers would report.
 
-        if current_position == end:  # Check if the current position is the end position
-            all_sequences.append(path)  # Add the path to the list of sequences
-            continue
+    Args:
+        to_end (sequence of int): The move distance from every square to the ending position.
+        start_idx (int): The packed index (row * 8 + col) of the starting position.
 
-        # Iterate over possible moves from the current position
-        for next_position in get_possible_moves(current_position):
-            if next_position not in visited:  # Check if the next position has not been visited
-                queue.append(path + [next_position])  # Add the new path to the queue
-                visited.add(next_position)  # Mark the next position as visited
+    Returns:
+        list of tuples: The sequence of (row, column) positions from the start to the end position.
 
-    return all_sequences  # Return all minimum-length sequences
+    Raises:
+        ValueError: If no knight move gets closer to the end, meaning the distances are inconsistent.
+    """
+    current = start_idx
+    path = [divmod(current, 8)]
+    for remaining in range(to_end[start_idx] - 1, -1, -1):
+        for next_idx in NEIGHBOR_INDICES[current]:
+            if to_end[next_idx] == remaining:
+                current = next_idx
+                break
+        else:
+            raise ValueError(f"no knight move from {divmod(current, 8)} is {remaining} moves from the end")
+        path.append(divmod(current, 8))
+    return path
 
 
 def generate_graphviz(start, end, all_sequences):
@@ -149,8 +217,10 @@ def generate_graphviz(start, end, all_sequences):
         all_sequences (list of lists): A list containing all minimum-length sequences of moves.
 
     Returns:
-        None
+        bytes: The graph rendered as a PNG image.
     """
+    import graphviz
+
     dot = graphviz.Digraph()
 
     # Add edges for all sequences
@@ -158,16 +228,19 @@ def generate_graphviz(start, end, all_sequences):
         for i in range(len(seq) - 1):
             x1, y1 = seq[i]
             x2, y2 = seq[i + 1]
-            dot.edge(get_position_name(x1, y1), get_position_name(x2, y2), color = 'blue')
+            dot.edge(POSITION_NAMES[x1 * 8 + y1], POSITION_NAMES[x2 * 8 + y2], color = 'blue')
 
     # Set attributes for the graph
     dot.attr(label = f"Shortest path from {get_position_name(*start)} to {get_position_name(*end)}")
     dot.attr(fontsize = '14')
     dot.attr(size = '8, 8')
 
-    # Render the graph to both dot and png formats
-    dot.render('shortest_paths_graph', format = 'png', cleanup = True)
+    # Save the graph in dot format and render the png in memory
     dot.render('all_shortest_path', format = 'dot', cleanup = True)
+    return dot.pipe(format = 'png')
+
+# Chessboard notation of every square, indexed by row * 8 + col
+POSITION_NAMES = tuple(chr(col + 65) + str(row + 1) for row in range(8) for col in range(8))
 
 def get_position_name(row, col):
     """
@@ -180,10 +253,11 @@ def get_position_name(row, col):
     Returns:
         str: The position in chessboard notation (e.g., 'A1').
     """
-    letter = chr(col + 65)
-    number = row + 1 
-    return letter + str(number)
+    return POSITION_NAMES[row * 8 + col]
+
 
+# Position of every square, keyed by its chessboard notation
+_NOTATION = {name: divmod(idx, 8) for idx, name in enumerate(POSITION_NAMES)}
 
 # Convert chess notation to position
 def chess_notation_to_position(chess_notation):
@@ -191,17 +265,17 @@ def chess_notation_to_position(chess_notation):
     Convert chess notation to position.
 
     Args:
-        chess_notation (str): The chess notation string (e.g., 'A1').
+        chess_notation (str): The chess notation string (e.g., 'A1'), in either case.
 
     Returns:
         tuple: A tuple representing the position (row, column).
+
+    Raises:
+        KeyError: If the notation does not name a square on the board.
     """
-    letter, number = chess_notation[0], chess_notation[1]
-    col = ord(letter) - ord('A')
-    row = int(number) - 1
-    return (row, col)
+    return _NOTATION[chess_notation.upper()]
 
-def main(start, end):
+def main(start, end, visualize = False):
     """
     Main function to execute the knight's shortest path program.
 
@@ -210,30 +284,48 @@ def main(start, end):
     paths, and displays the results including the minimum-length sequences, 
     chessboard with paths, and the generated graph.
 
+    Args:
+        start (str): Starting position in algebraic chess notation (e.g., 'A1').
+        end (str): Ending position in algebraic chess notation (e.g., 'H8').
+        visualize (bool): Whether to render the Graphviz graph and show the chessboard
+            plot. Only the sequences are printed when False.
+
+    Returns:
+        list of lists: A list containing all minimum-length sequences of moves.
+
     Raises:
         ValueError: If the starting or ending point is not within the valid range.
 
     """
     #start = input("Enter the starting position (e.g., 'A1'): ").upper()
     #end = input("Enter the ending position (e.g., 'H8'): ").upper()
-    # Convert chess notation to position
-    start = chess_notation_to_position(start)
-    end = chess_notation_to_position(end)
-    # Check if start and end are within the valid range
-    if not all(0 <= value < 8 for value in start):
-        raise ValueError("starting point is not within the valid range")
-    if not all(0 <= value < 8 for value in end):
-        raise ValueError("end is not within the valid range")
+    # Convert chess notation to position, rejecting squares outside the board
+    try:
+        start = chess_notation_to_position(start)
+    except KeyError:
+        raise ValueError("starting point is not within the valid range") from None
+    try:
+        end = chess_notation_to_position(end)
+    except KeyError:
+        raise ValueError("end is not within the valid range") from None
     
     # Find the shortest path from all possible path
     all_sequences = shortest_path(start, end)
-    # Generate graph visualization
-    generate_graphviz(start, end, all_sequences)
     
     # Print minimum-length sequences
     print("All minimum-length sequences:")
     for seq in all_sequences:
-        print([get_position_name(x, y) for x, y in seq])
+        print([POSITION_NAMES[x * 8 + y] for x, y in seq])
+
+    if not visualize:
+        return all_sequences
+
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import ListedColormap
+    import numpy as np
+
+    # Generate graph visualization
+    graph_png = generate_graphviz(start, end, all_sequences)
         
     # addition to the dot file, display chessboard and graph
     # side by side with custom tick parameters, column names, 
@@ -260,10 +352,11 @@ def main(start, end):
     for i in range(8):
         ax1.text(i, -1.1, chr(65 + i), ha = 'center', va = 'center', fontsize = 12)
         ax1.text( -1.1, i , i +1, ha = 'center', va = 'center', fontsize = 12)
-    ax2.imshow(plt.imread('shortest_paths_graph.png'))
+    ax2.imshow(plt.imread(io.BytesIO(graph_png), format = 'png'))
     ax2.axis('off')
     plt.savefig('./shortest_path_knight.png')
     plt.show()
+    return all_sequences
 
 if __name__ == "__main__":
     """
@@ -285,5 +378,5 @@ if __name__ == "__main__":
     parser.add_argument('start', type = str, help = 'Starting position in algebraic chess notation')
     parser.add_argument('end', type = str, help = 'Ending position in algebraic chess notation')
     args = parser.parse_args()
-    main(args.start, args.end)
+    main(args.start, args.end, visualize = True)
 
@@ -1,5 +1,6 @@
 import unittest
 from knight_solution import Chessboard, Knight, get_possible_moves, shortest_path, chess_notation_to_position
+from knight_solution import _bfs, _reconstruct_path
 
 class TestKnightSolution(unittest.TestCase):
     """
@@ -11,7 +12,13 @@ class TestKnightSolution(unittest.TestCase):
         test_invalid_position: Test if Knight.can_move returns False for invalid positions.
         test_possible_moves: Test if get_possible_moves returns the correct possible moves for a given position.
         test_shortest_path: Test if shortest_path returns the correct shortest path between two positions.
+        test_shortest_path_same_square: Test if shortest_path handles start and end being the same square.
+        test_shortest_path_off_board: Test if shortest_path returns no paths for off-board squares.
+        test_off_board_query_keeps_later_queries_valid: Test if an off-board end does not corrupt later queries.
+        test_reconstruct_path_inconsistent_distances: Test if _reconstruct_path raises on inconsistent distances.
+        test_bfs_distances: Test if _bfs agrees with a plain breadth-first search.
         test_chess_notation_to_position: Test if chess_notation_to_position converts chess notation to position correctly.
+        test_invalid_chess_notation: Test if chess_notation_to_position rejects squares outside the board.
     """
 
     def test_chess_build_chessboard(self):
@@ -20,9 +27,12 @@ class TestKnightSolution(unittest.TestCase):
 
         Asserts:
             - The shape of the chessboard is (8, 8).
+            - Neighbouring squares alternate in colour, starting with 0 at (0, 0).
         """
         chessboard = Chessboard.build(4, 4)
         self.assertEqual(chessboard.shape, (8, 8))
+        self.assertEqual(chessboard[0].tolist(), [0, 1, 0, 1, 0, 1, 0, 1])
+        self.assertEqual(chessboard[:, 0].tolist(), [0, 1, 0, 1, 0, 1, 0, 1])
 
     def test_valid_position(self):
         """
@@ -67,6 +77,57 @@ class TestKnightSolution(unittest.TestCase):
         expected_path = [[(0, 0), (1, 2), (2, 4), (3, 6), (4, 4), (5, 6), (7, 7)]]
         self.assertEqual(path, expected_path)
 
+    def test_shortest_path_same_square(self):
+        """
+        Test if shortest_path returns the single-square path when start and end coincide.
+        """
+        path = shortest_path((3, 3), (3, 3))
+        self.assertEqual(path, [[(3, 3)]])
+
+    def test_shortest_path_off_board(self):
+        """
+        Test if shortest_path returns no paths when the start or end is off the board.
+        """
+        for start, end in [((0, 0), (0, 8)), ((0, 0), (-1, 0)), ((8, 0), (0, 0)), ((0, -1), (7, 7))]:
+            self.assertEqual(shortest_path(start, end), [], f"{start} -> {end} should have no path.")
+
+    def test_off_board_query_keeps_later_queries_valid(self):
+        """
+        Test if an off-board end square leaves the memoized distances intact for later queries.
+        """
+        self.assertEqual(shortest_path((0, 0), (-1, 0)), [])
+        path = shortest_path((0, 0), (7, 0))[0]
+        self.assertEqual(path[0], (0, 0))
+        self.assertEqual(path[-1], (7, 0))
+        self.assertEqual(len(set(path)), len(path))
+
+    def test_reconstruct_path_inconsistent_distances(self):
+        """
+        Test if _reconstruct_path raises instead of repeating a square when no move gets closer to the end.
+        """
+        to_end = [-1] * 64
+        to_end[0] = 2
+        with self.assertRaises(ValueError):
+            _reconstruct_path(to_end, 0)
+
+    def test_bfs_distances(self):
+        """
+        Test if _bfs agrees with a plain breadth-first search over get_possible_moves from every square.
+        """
+        for source in range(64):
+            expected = {divmod(source, 8): 0}
+            layer = [divmod(source, 8)]
+            while layer:
+                next_layer = []
+                for position in layer:
+                    for move in get_possible_moves(position):
+                        if move not in expected:
+                            expected[move] = expected[position] + 1
+                            next_layer.append(move)
+                layer = next_layer
+            dist = _bfs(source)
+            self.assertEqual([dist[idx] for idx in range(64)], [expected[divmod(idx, 8)] for idx in range(64)])
+
     def test_chess_notation_to_position(self):
         """
         Test if chess_notation_to_position converts chess notation to position correctly.
@@ -77,6 +138,15 @@ class TestKnightSolution(unittest.TestCase):
         position = chess_notation_to_position('A1')
         expected_position = (0, 0)
         self.assertEqual(position, expected_position)
+        self.assertEqual(chess_notation_to_position('h8'), (7, 7))
+
+    def test_invalid_chess_notation(self):
+        """
+        Test if chess_notation_to_position rejects squares outside the board.
+        """
+        for chess_notation in ['I1', 'A9', 'A0', 'A10', '']:
+            with self.assertRaises(KeyError):
+                chess_notation_to_position(chess_notation)
 
 if __name__ == '__main__':
     unittest.main()